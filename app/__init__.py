@@ -2,4 +2,7 @@ from flask import Flask
 
 app = Flask(__name__)
 
+# Skip sorting the keys of every dict in large API payloads such as the process list
+app.json.sort_keys = False
+
 from app import views
\ No newline at end of file
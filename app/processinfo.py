@@ -1,8 +1,10 @@
 import psutil
 from psutil._common import bytes2human
 from datetime import datetime
+from functools import lru_cache
 from .systeminfo import get_user_info
 import os
+import time
 
 def get_process_list(filter_by_user=False):
     processes_list = {}
@@ -24,8 +26,12 @@ def get_process_list(filter_by_user=False):
     return processes_list
 
 def get_process_details(pid):
+    # Only fetch the attributes we display instead of everything as_dict() collects
+    process_attributes_list = ['pid', 'name', 'username', 'status', 'create_time', 'exe', 'num_threads',
+                               'memory_info', 'memory_percent', 'cpu_percent', 'cpu_times']
+
     if psutil.pid_exists(pid):
-        process_info = psutil.Process(pid).as_dict()
+        process_info = psutil.Process(pid).as_dict(attrs=process_attributes_list)
         process_data = {
             "create_time": datetime.fromtimestamp(process_info['create_time']),
             "status": process_info['status'],
@@ -42,4 +48,31 @@ def get_process_details(pid):
         }
         return process_data
     else:
-        return None
\ No newline at end of file
+        return None
+
+@lru_cache(maxsize=4096)
+def format_create_time(create_time):
+    # A process's start time never changes, so format each one only once across polls
+    return datetime.fromtimestamp(create_time).strftime('%Y-%m-%d %H:%M:%S')
+
+# Process handles reused across /api/processes/<pid>/stats polls, keyed by pid
+_tracked_processes = {}
+
+def get_tracked_process(pid):
+    # Keeping the same psutil.Process between polls lets cpu_percent() measure
+    # against the previous request instead of sleeping to take two samples
+    process = _tracked_processes.get(pid)
+    if process is not None and process.is_running():
+        return process
+
+    # Drop handles for processes that have exited before tracking a new one
+    for tracked_pid, tracked in list(_tracked_processes.items()):
+        if not tracked.is_running():
+            _tracked_processes.pop(tracked_pid, None)
+
+    process = psutil.Process(pid)
+    # First sample for this process: prime the counter and wait once for a real reading
+    process.cpu_percent()
+    time.sleep(0.1)
+    _tracked_processes[pid] = process
+    return process
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 import json
 import os
+import stat
+import tempfile
 from typing import Dict, List, Tuple, Any
 
 class ProductivityTracker:
@@ -45,13 +47,44 @@ class ProductivityTracker:
 
     def save_data(self, data: Dict) -> None:
         """Save productivity data to the JSON file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a uniquely named temp file, flush it to disk and swap it in,
+        # so neither a crash nor a concurrent save leaves a torn file behind
+        data_dir, data_name = os.path.split(self.data_file)
+        with tempfile.NamedTemporaryFile('w', dir=data_dir, prefix=data_name + '.', suffix='.tmp',
+                                         delete=False) as f:
+            tmp_file = f.name
+            try:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+                # mkstemp creates the file as 0600; keep the data file's existing permissions
+                if os.path.exists(self.data_file):
+                    os.chmod(tmp_file, stat.S_IMODE(os.stat(self.data_file).st_mode))
+            except BaseException:
+                f.close()
+                os.remove(tmp_file)
+                raise
+        try:
+            os.replace(tmp_file, self.data_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
 
     def add_activity(self, category: str, start_time: datetime, end_time: datetime, description: str = "") -> None:
         """Add a new activity to the tracker."""
         data = self.load_data()
+        self._append_activity(data, category, start_time, end_time, description)
+        self.save_data(data)
+
+    def add_workblock(self, start_time: datetime, activity: str) -> None:
+        """Add a new workblock to the tracker."""
+        data = self.load_data()
+        self._append_workblock(data, start_time, activity)
+        self.save_data(data)
 
+    def _append_activity(self, data: Dict, category: str, start_time: datetime, end_time: datetime,
+                         description: str = "") -> None:
+        """Append an activity to already loaded data without saving it."""
         # Calculate duration in minutes
         duration = (end_time - start_time).total_seconds() / 60
 
@@ -66,12 +99,9 @@ class ProductivityTracker:
         }
 
         data["activities"].append(activity)
-        self.save_data(data)
-
-    def add_workblock(self, start_time: datetime, activity: str) -> None:
-        """Add a new workblock to the tracker."""
-        data = self.load_data()
 
+    def _append_workblock(self, data: Dict, start_time: datetime, activity: str) -> None:
+        """Append a workblock to already loaded data without saving it."""
         workblock = {
             "id": len(data["workblocks"]) + 1,
             "start_time": start_time.isoformat(),
@@ -80,7 +110,6 @@ class ProductivityTracker:
         }
 
         data["workblocks"].append(workblock)
-        self.save_data(data)
 
     def get_daily_scores(self, date=None) -> Dict[str, Dict[str, Any]]:
         """Get the daily scores for focus, meetings, and breaks."""
@@ -145,18 +174,18 @@ class ProductivityTracker:
         data = self.load_data()
         activities = [a for a in data["activities"] if a["date"] == date_str]
 
+        # Index category colors by name once instead of scanning settings per category
+        category_colors = {c["name"]: c["color"] for c in data["settings"]["categories"]}
+
         # Group by all categories
         categories = {}
         for activity in activities:
             category = activity["category"]
             if category not in categories:
-                # Find color from settings
-                color = next((c["color"] for c in data["settings"]["categories"]
-                             if c["name"] == category), "#888888")
                 categories[category] = {
                     "minutes": 0,
                     "percentage": 0,
-                    "color": color
+                    "color": category_colors.get(category, "#888888")
                 }
             categories[category]["minutes"] += activity["duration"]
 
@@ -232,7 +261,7 @@ class ProductivityTracker:
         for block in workblocks:
             hour, minute = map(int, block["time"].split(":"))
             block_time = datetime.combine(date, datetime.min.time().replace(hour=hour, minute=minute))
-            self.add_workblock(block_time, block["activity"])
+            self._append_workblock(data, block_time, block["activity"])
 
         # Generate activities with durations
         activities = [
@@ -255,21 +284,24 @@ class ProductivityTracker:
         # Add main category activities
         start_time = datetime.combine(date, datetime.min.time().replace(hour=9))
 
-        self.add_activity("Focus", start_time, start_time + timedelta(minutes=focus_time))
-        self.add_activity("Meetings", start_time, start_time + timedelta(minutes=meeting_time))
-        self.add_activity("Breaks", start_time, start_time + timedelta(minutes=break_time))
+        self._append_activity(data, "Focus", start_time, start_time + timedelta(minutes=focus_time))
+        self._append_activity(data, "Meetings", start_time, start_time + timedelta(minutes=meeting_time))
+        self._append_activity(data, "Breaks", start_time, start_time + timedelta(minutes=break_time))
 
         # Add detailed activities
         current_time = start_time
         for activity in activities:
             end_time = current_time + timedelta(minutes=activity["duration"])
-            self.add_activity(activity["category"], current_time, end_time)
+            self._append_activity(data, activity["category"], current_time, end_time)
             current_time = end_time
 
         # Add upcoming meeting in 54 minutes from now
         now = datetime.now()
         meeting_time = now + timedelta(minutes=54)
-        self.add_activity("Meetings", meeting_time, meeting_time + timedelta(minutes=30), "Team Sync")
+        self._append_activity(data, "Meetings", meeting_time, meeting_time + timedelta(minutes=30), "Team Sync")
+
+        # Write everything generated above in a single save
+        self.save_data(data)
 
         print(f"Generated mock data for {date.isoformat()}")
 
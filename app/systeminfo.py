@@ -1,11 +1,34 @@
+import os
 import platform
 import psutil
+import threading
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from psutil._common import bytes2human
 
-def get_platform_info():
+APP_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+
+# Windows-specific log directories and event logs
+WINDOWS_LOG_DIRS = [
+    os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'Logs'),
+    os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'debug'),
+    os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'system32', 'winevt', 'Logs'),
+    os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'LogFiles'),
+    os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'config'),
+    os.path.join(os.environ.get('SYSTEMDRIVE', 'C:'), 'ProgramData', 'Microsoft', 'Windows', 'WER'),
+    'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportArchive',
+    'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportQueue'
+]
+
+# Common log file extensions
+LOG_EXTENSIONS = frozenset(['.log', '.txt', '.evt', '.evtx', '.etl', '.wer', '.dmp'])
+
+@lru_cache(maxsize=1)
+def get_static_platform_info():
+    # None of this changes while the app runs, and platform.architecture()
+    # shells out to `file` on every call, so probe it only once
     uname = platform.uname()
-    boot_time = psutil.boot_time()
     if psutil.MACOS:
         os_name = 'apple'
     elif psutil.WINDOWS:
@@ -15,13 +38,20 @@ def get_platform_info():
     else:
         os_name = 'Unknown'
 
-    platform_info = {
+    return {
         'os_name': os_name,
         'node_name': uname.node.split('.')[0],
         'system_name': uname.system,
         'release_version': uname.release,
         'architecture': platform.architecture()[0],
         'processor_type': platform.processor(),
+    }
+
+def get_platform_info():
+    boot_time = psutil.boot_time()
+
+    platform_info = {
+        **get_static_platform_info(),
         'boot_time': datetime.now() - datetime.fromtimestamp(boot_time),
 
     }
@@ -137,4 +167,78 @@ def get_disk_io():
             }
     except (PermissionError, OSError):
         pass
-    return disk_io
\ No newline at end of file
+    return disk_io
+
+def get_log_files():
+    log_files = []
+
+    # Check Windows logs
+    for log_dir in WINDOWS_LOG_DIRS:
+        if os.path.exists(log_dir):
+            try:
+                for root, dirs, files in os.walk(log_dir):
+                    for file in files:
+                        file_ext = os.path.splitext(file)[1].lower()
+                        if file_ext in LOG_EXTENSIONS:
+                            try:
+                                full_path = os.path.join(root, file)
+                                file_size = os.path.getsize(full_path)
+                                log_files.append({
+                                    'name': file,
+                                    'path': full_path,
+                                    'size': bytes2human(file_size),
+                                    'modified': datetime.fromtimestamp(os.path.getmtime(full_path)),
+                                    'type': 'system' if 'windows' in full_path.lower() else 'application'
+                                })
+                                # Limit to 50 files to prevent overload
+                                if len(log_files) >= 50:
+                                    break
+                            except (PermissionError, OSError):
+                                continue
+                    if len(log_files) >= 50:
+                        break
+            except (PermissionError, OSError):
+                pass
+
+    # Also check application logs
+    if os.path.exists(APP_LOG_DIR):
+        for file in os.listdir(APP_LOG_DIR):
+            if os.path.splitext(file)[1].lower() in LOG_EXTENSIONS:
+                full_path = os.path.join(APP_LOG_DIR, file)
+                log_files.append({
+                    'name': file,
+                    'path': full_path,
+                    'size': bytes2human(os.path.getsize(full_path)),
+                    'modified': datetime.fromtimestamp(os.path.getmtime(full_path)),
+                    'type': 'application'
+                })
+
+    # Sort logs by modification time (newest first)
+    log_files.sort(key=itemgetter('modified'), reverse=True)
+
+    return log_files
+
+# System-wide CPU times from the previous get_cpu_percent() call. psutil.cpu_percent(interval=None)
+# keeps its last sample per thread, so every new request thread would start with a bogus
+# reading; one shared sample measures usage since the last poll from any thread.
+_cpu_sample = {'times': psutil.cpu_times(), 'percent': 0.0}
+_cpu_sample_lock = threading.Lock()
+
+def _cpu_busy_and_total(times):
+    # Guest time is already counted in user/nice on Linux, and iowait is idle time
+    total = sum(times) - getattr(times, 'guest', 0) - getattr(times, 'guest_nice', 0)
+    idle = times.idle + getattr(times, 'iowait', 0)
+    return total - idle, total
+
+def get_cpu_percent():
+    # CPU usage across all cores since the previous call, without blocking the request
+    current = psutil.cpu_times()
+    with _cpu_sample_lock:
+        busy, total = _cpu_busy_and_total(current)
+        last_busy, last_total = _cpu_busy_and_total(_cpu_sample['times'])
+        # Polls landing in the same clock tick have nothing to measure; repeat the last reading
+        if total > last_total:
+            percent = (busy - last_busy) / (total - last_total) * 100
+            _cpu_sample['percent'] = round(min(max(percent, 0.0), 100.0), 1)
+            _cpu_sample['times'] = current
+        return _cpu_sample['percent']
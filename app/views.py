@@ -1,15 +1,30 @@
 from app import app
 from flask import render_template, url_for, redirect, jsonify, request, send_file
 from .systeminfo import *
-from .processinfo import get_process_list, get_process_details
+from .processinfo import get_process_details, get_tracked_process, format_create_time
 import os
 import psutil
+from collections import Counter, deque
 from datetime import datetime
+from operator import itemgetter
 import time
 import platform
 import signal
 import ctypes
 import socket
+import subprocess
+
+# Resolve the platform once instead of on every kill request
+IS_WINDOWS = platform.system() == 'Windows'
+
+# Processes that must never be terminated from the dashboard
+CRITICAL_PROCESSES = frozenset(['system', 'systemd', 'svchost.exe', 'csrss.exe', 'winlogon.exe', 'services.exe'])
+
+# How long a process list scan is reused across /api/processes requests (seconds). A single
+# tab polls every 2s and never hits this; it only spares a scan when several clients poll the
+# same worker process within the window, as each gunicorn worker keeps its own copy.
+PROCESS_CACHE_TTL = 1.0
+_process_cache = {'payload': None, 'expires': 0.0}
 
 @app.route('/')
 def main():
@@ -18,12 +33,10 @@ def main():
 
 @app.route('/dashboard')
 def index():
+    # Only gather what the template renders; the live panels are filled in by the API polls
     context = {
         'platform_info': get_platform_info(),
-        'power_info': get_power_info(),
-        'user_info': get_user_info(),
         'memory_info': get_memory_info(),
-        'disk_info': get_disks_info(),
         'network_info': get_network_info(),
     }
 
@@ -31,9 +44,9 @@ def index():
 
 @app.route('/processes')
 def processes():
+    # The process table is loaded from /api/processes, so don't scan processes here too
     context = {
         'platform_info': get_platform_info(),
-        'process_list': get_process_list(),
     }
     return render_template("processes.html", context=context)
 
@@ -58,94 +71,31 @@ def network():
 
 @app.route('/disks')
 def disks():
+    # Disk cards and I/O counters are loaded from /api/disks
     context = {
         'platform_info': get_platform_info(),
-        'disk_info': get_disks_info(),
-        'disk_io': psutil.disk_io_counters(perdisk=True),
     }
     return render_template("disks.html", context=context)
 
 @app.route('/logs')
 def logs():
-    log_files = []
-    
-    # Windows-specific log directories and event logs
-    windows_logs = [
-        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'Logs'),
-        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'debug'),
-        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'system32', 'winevt', 'Logs'),
-        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'LogFiles'),
-        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'config'),
-        os.path.join(os.environ.get('SYSTEMDRIVE', 'C:'), 'ProgramData', 'Microsoft', 'Windows', 'WER'),
-        'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportArchive',
-        'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportQueue'
-    ]
-    
-    # Common log file extensions
-    log_extensions = ['.log', '.txt', '.evt', '.evtx', '.etl', '.wer', '.dmp']
-    
-    # Check Windows logs
-    for log_dir in windows_logs:
-        if os.path.exists(log_dir):
-            try:
-                for root, dirs, files in os.walk(log_dir):
-                    for file in files:
-                        file_ext = os.path.splitext(file)[1].lower()
-                        if file_ext in log_extensions:
-                            try:
-                                full_path = os.path.join(root, file)
-                                file_size = os.path.getsize(full_path)
-                                log_files.append({
-                                    'name': file,
-                                    'path': full_path,
-                                    'size': bytes2human(file_size),
-                                    'modified': datetime.fromtimestamp(os.path.getmtime(full_path))
-                                })
-                                # Limit to 50 files to prevent overload
-                                if len(log_files) >= 50:
-                                    break
-                            except (PermissionError, OSError):
-                                continue
-                    if len(log_files) >= 50:
-                        break
-            except (PermissionError, OSError):
-                pass
-    
-    # Also check application logs
-    app_log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-    if not os.path.exists(app_log_dir):
-        os.makedirs(app_log_dir, exist_ok=True)
+    # Make sure there is at least an application log to show
+    if not os.path.exists(APP_LOG_DIR):
+        os.makedirs(APP_LOG_DIR, exist_ok=True)
         # Create a sample log file
-        with open(os.path.join(app_log_dir, 'app.log'), 'w') as f:
+        with open(os.path.join(APP_LOG_DIR, 'app.log'), 'w') as f:
             f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Application started\n")
-    
-    # Add application logs
-    if os.path.exists(app_log_dir):
-        for file in os.listdir(app_log_dir):
-            if file.endswith(tuple(log_extensions)):
-                full_path = os.path.join(app_log_dir, file)
-                log_files.append({
-                    'name': file,
-                    'path': full_path,
-                    'size': bytes2human(os.path.getsize(full_path)),
-                    'modified': datetime.fromtimestamp(os.path.getmtime(full_path))
-                })
-    
-    # Sort logs by modification time (newest first)
-    log_files.sort(key=lambda x: x['modified'], reverse=True)
-    
+
     context = {
         'platform_info': get_platform_info(),
-        'log_files': log_files,
+        'log_files': get_log_files(),
     }
     return render_template("logs.html", context=context)
 
 @app.route('/api/system-stats')
 def system_stats():
-    import psutil
-    
-    # Get CPU usage as percentage
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+    # Get CPU usage as percentage since the previous poll
+    cpu_percent = get_cpu_percent()
     
     # Get memory usage
     memory = psutil.virtual_memory()
@@ -181,41 +131,19 @@ def system_stats():
             else:
                 battery_info['status'] = 'Discharging'
             
-            # Calculate time remaining
+            # Calculate time remaining from the OS estimate rather than blocking to sample the drain rate
             if not battery.power_plugged:
-                try:
-                    # Get battery drain rate over last minute
-                    battery_rate = psutil.sensors_battery().percent
-                    # Wait for a short time to calculate rate
-                    time.sleep(0.5)
-                    current_percent = psutil.sensors_battery().percent
-                    drain_rate = (battery_rate - current_percent) * 2  # percent per minute
-
-                    if drain_rate > 0:  # If battery is actually draining
-                        # Calculate minutes remaining based on current drain rate
-                        minutes_remaining = current_percent / drain_rate if drain_rate > 0 else 0
-                        hours = int(minutes_remaining // 60)
-                        minutes = int(minutes_remaining % 60)
-                        battery_info['time_remaining'] = f"{hours}h {minutes}m remaining"
-                    else:
-                        # Fallback to system provided value if available and reasonable
-                        if battery.secsleft > 0 and battery.secsleft < 43200:  # Less than 12 hours
-                            hours, remainder = divmod(battery.secsleft, 3600)
-                            minutes, _ = divmod(remainder, 60)
-                            battery_info['time_remaining'] = f"{hours}h {minutes}m remaining"
-                        else:
-                            # Very rough estimate as last resort
-                            hours = int((battery.percent / 100.0) * 4)  # Assuming 4 hours at 100%
-                            minutes = int(((battery.percent / 100.0) * 4 - hours) * 60)
-                            battery_info['time_remaining'] = f"{hours}h {minutes}m remaining (estimated)"
-                except:
-                    # Fallback to basic calculation if rate calculation fails
-                    if battery.percent > 0:
-                        hours = int((battery.percent / 100.0) * 4)  # Assuming 4 hours at 100%
-                        minutes = int(((battery.percent / 100.0) * 4 - hours) * 60)
-                        battery_info['time_remaining'] = f"{hours}h {minutes}m remaining (estimated)"
-                    else:
-                        battery_info['time_remaining'] = "Low battery"
+                if battery.secsleft > 0 and battery.secsleft < 43200:  # Less than 12 hours
+                    hours, remainder = divmod(battery.secsleft, 3600)
+                    minutes, _ = divmod(remainder, 60)
+                    battery_info['time_remaining'] = f"{hours}h {minutes}m remaining"
+                elif battery.percent > 0:
+                    # Very rough estimate as last resort
+                    hours = int((battery.percent / 100.0) * 4)  # Assuming 4 hours at 100%
+                    minutes = int(((battery.percent / 100.0) * 4 - hours) * 60)
+                    battery_info['time_remaining'] = f"{hours}h {minutes}m remaining (estimated)"
+                else:
+                    battery_info['time_remaining'] = "Low battery"
             elif battery.power_plugged:
                 if battery.percent >= 100:
                     battery_info['time_remaining'] = "Fully charged"
@@ -236,10 +164,6 @@ def system_stats():
 
 @app.route('/api/system-info')
 def system_info():
-    import psutil
-    import platform
-    from datetime import datetime
-    
     # Get platform information
     uname = platform.uname()
     boot_time = psutil.boot_time()
@@ -288,9 +212,10 @@ def system_info():
 
 @app.route('/api/processes')
 def get_processes():
-    import psutil
-    from datetime import datetime
-    
+    # Clients polling at nearly the same moment share one scan of the process table
+    if time.monotonic() < _process_cache['expires']:
+        return jsonify(_process_cache['payload'])
+
     processes = []
     try:
         # Get all processes with detailed info
@@ -298,8 +223,7 @@ def get_processes():
             try:
                 pinfo = proc.info
                 # Format create time
-                create_time = datetime.fromtimestamp(pinfo['create_time'])
-                pinfo['create_time'] = create_time.strftime('%Y-%m-%d %H:%M:%S')
+                pinfo['create_time'] = format_create_time(pinfo['create_time'])
                 
                 processes.append({
                     'pid': pinfo['pid'],
@@ -314,24 +238,29 @@ def get_processes():
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
         
-        # Calculate accurate process statistics
+        # Calculate accurate process statistics in a single pass over the list
+        status_counts = Counter(p['status'].lower() for p in processes)
         process_stats = {
             'total': len(processes),
-            'running': len([p for p in processes if p['status'].lower() == 'running']),
-            'sleeping': len([p for p in processes if p['status'].lower() == 'sleeping']),
-            'stopped': len([p for p in processes if p['status'].lower() == 'stopped']),
-            'zombie': len([p for p in processes if p['status'].lower() == 'zombie']),
-            'disk_sleep': len([p for p in processes if p['status'].lower() == 'disk-sleep']),
-            'idle': len([p for p in processes if p['status'].lower() == 'idle'])
+            'running': status_counts['running'],
+            'sleeping': status_counts['sleeping'],
+            'stopped': status_counts['stopped'],
+            'zombie': status_counts['zombie'],
+            'disk_sleep': status_counts['disk-sleep'],
+            'idle': status_counts['idle']
         }
         
         # Sort processes by CPU usage for most active first
-        processes.sort(key=lambda x: (x['cpu_percent'], x['memory_percent']), reverse=True)
+        processes.sort(key=itemgetter('cpu_percent', 'memory_percent'), reverse=True)
         
-        return jsonify({
+        payload = {
             'processes': processes,
             'stats': process_stats
-        })
+        }
+        _process_cache['payload'] = payload
+        _process_cache['expires'] = time.monotonic() + PROCESS_CACHE_TTL
+
+        return jsonify(payload)
         
     except Exception as e:
         return jsonify({
@@ -364,7 +293,6 @@ def kill_process(pid):
         
         try:
             # Fallback to taskkill without /F first
-            import subprocess
             subprocess.run(['taskkill', '/PID', str(pid)], 
                          check=True, 
                          capture_output=True,
@@ -398,7 +326,7 @@ def kill_process(pid):
         process = psutil.Process(pid)
         
         # Don't allow termination of critical system processes
-        if process.name().lower() in ['system', 'systemd', 'svchost.exe', 'csrss.exe', 'winlogon.exe', 'services.exe']:
+        if process.name().lower() in CRITICAL_PROCESSES:
             return jsonify({
                 'success': False,
                 'error': 'Cannot terminate critical system process'
@@ -415,7 +343,7 @@ def kill_process(pid):
             pass
         
         # If psutil's terminate fails, try system-specific methods
-        if platform.system() == 'Windows':
+        if IS_WINDOWS:
             if terminate_windows_process(pid):
                 return jsonify({'success': True})
         else:
@@ -441,7 +369,7 @@ def kill_process(pid):
         })
     except psutil.AccessDenied:
         # Try system-specific methods if psutil is denied access
-        if platform.system() == 'Windows':
+        if IS_WINDOWS:
             if terminate_windows_process(pid):
                 return jsonify({'success': True})
         else:
@@ -461,11 +389,10 @@ def kill_process(pid):
 @app.route('/api/processes/<int:pid>/stats')
 def get_process_stats(pid):
     try:
-        process = psutil.Process(pid)
+        process = get_tracked_process(pid)
         with process.oneshot():  # Get all info in a single system call
-            # Get initial CPU percent
-            process.cpu_percent()
-            time.sleep(0.1)  # Wait for accurate measurement
+            # CPU usage since the previous poll of this process
+            cpu_percent = process.cpu_percent()
             
             # Get memory info directly
             memory_info = process.memory_info()
@@ -494,7 +421,7 @@ def get_process_stats(pid):
                 num_threads = 0
             
             return jsonify({
-                'cpu_percent': process.cpu_percent(),
+                'cpu_percent': cpu_percent,
                 'memory_percent': memory_percent,
                 'memory_info': {
                     'rss': getattr(memory_info, 'rss', 0),  # Physical memory
@@ -601,70 +528,10 @@ def disk_stats():
 @app.route('/api/logs')
 def get_logs():
     try:
-        log_files = []
-        
-        # Windows-specific log directories and event logs
-        windows_logs = [
-            os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'Logs'),
-            os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'debug'),
-            os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'system32', 'winevt', 'Logs'),
-            os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'LogFiles'),
-            os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'System32', 'config'),
-            os.path.join(os.environ.get('SYSTEMDRIVE', 'C:'), 'ProgramData', 'Microsoft', 'Windows', 'WER'),
-            'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportArchive',
-            'C:\\ProgramData\\Microsoft\\Windows\\WER\\ReportQueue'
-        ]
-        
-        # Common log file extensions
-        log_extensions = ['.log', '.txt', '.evt', '.evtx', '.etl', '.wer', '.dmp']
-        
-        # Check Windows logs
-        for log_dir in windows_logs:
-            if os.path.exists(log_dir):
-                try:
-                    for root, dirs, files in os.walk(log_dir):
-                        for file in files:
-                            file_ext = os.path.splitext(file)[1].lower()
-                            if file_ext in log_extensions:
-                                try:
-                                    full_path = os.path.join(root, file)
-                                    file_size = os.path.getsize(full_path)
-                                    modified_time = datetime.fromtimestamp(os.path.getmtime(full_path))
-                                    log_files.append({
-                                        'name': file,
-                                        'path': full_path,
-                                        'size': bytes2human(file_size),
-                                        'modified': modified_time.strftime('%Y-%m-%d %H:%M:%S'),
-                                        'type': 'system' if 'windows' in full_path.lower() else 'application'
-                                    })
-                                    # Limit to 50 files to prevent overload
-                                    if len(log_files) >= 50:
-                                        break
-                                except (PermissionError, OSError):
-                                    continue
-                        if len(log_files) >= 50:
-                            break
-                except (PermissionError, OSError):
-                    pass
-        
-        # Also check application logs
-        app_log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-        if os.path.exists(app_log_dir):
-            for file in os.listdir(app_log_dir):
-                if file.endswith(tuple(log_extensions)):
-                    full_path = os.path.join(app_log_dir, file)
-                    modified_time = datetime.fromtimestamp(os.path.getmtime(full_path))
-                    log_files.append({
-                        'name': file,
-                        'path': full_path,
-                        'size': bytes2human(os.path.getsize(full_path)),
-                        'modified': modified_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'type': 'application'
-                    })
-        
-        # Sort logs by modification time (newest first)
-        log_files.sort(key=lambda x: x['modified'], reverse=True)
-        
+        log_files = get_log_files()
+        for log in log_files:
+            log['modified'] = log['modified'].strftime('%Y-%m-%d %H:%M:%S')
+
         return jsonify({
             'success': True,
             'log_files': log_files
@@ -703,15 +570,15 @@ def get_log_content():
                     'content': ''
                 })
             
-        # Read last 100 lines of the log file
+        # Read last 100 lines of the log file without loading the whole file
         try:
             with open(log_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[-100:]
+                lines = deque(f, maxlen=100)
                 content = ''.join(lines)
         except UnicodeDecodeError:
             try:
                 with open(log_path, 'r', encoding='latin1') as f:
-                    lines = f.readlines()[-100:]
+                    lines = deque(f, maxlen=100)
                     content = ''.join(lines)
             except:
                 return jsonify({